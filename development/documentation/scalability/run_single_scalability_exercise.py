@@ -62,8 +62,7 @@ def main():
 
     # Save time to file
     with open("scalability_results.txt", "a+") as file:
-        file.write(json.dumps(output))
-        file.write("\n")
+        file.write(json.dumps(output) + "\n")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ import pickle
 import socket
 
 import click
+import joblib
 import numpy as np
 
 from respy.config import TEST_RESOURCES_DIR
@@ -28,7 +29,7 @@ def _prepare_message(idx_failures):
     return subject, message
 
 
-def run_regression_tests(n_tests, strict, notification):
+def run_regression_tests(n_tests, strict, notification, n_jobs=1):
     """Run regression tests.
 
     Parameters
@@ -39,12 +40,16 @@ def run_regression_tests(n_tests, strict, notification):
         Early failure on error.
     notification : bool, default True
         Send notification with test report.
+    n_jobs : int, default 1
+        Number of processes to run the independent tests in parallel.
 
     """
     tests = load_regression_tests()
     tests = tests[: n_tests + 1]
 
-    results = [_check_single(test, strict) for test in tests]
+    results = joblib.Parallel(n_jobs=n_jobs)(
+        joblib.delayed(_check_single)(test, strict) for test in tests
+    )
     idx_failures = [i for i, x in enumerate(results) if not x]
 
     if idx_failures:
@@ -99,7 +104,8 @@ def _check_single(test, strict):
         is_success = np.isclose(
             crit_val, exp_val, rtol=TOL_REGRESSION_TESTS, atol=TOL_REGRESSION_TESTS
         )
-    except Exception:
+    except Exception as e:
+        click.secho(f"Regression test raised {type(e).__name__}: {e}", fg="red")
         is_success = False
 
     if strict is True:
@@ -132,10 +138,14 @@ def cli():
 @click.argument("number_of_tests", type=int)
 @click.option("--strict", is_flag=True, help="Immediate termination on failure.")
 @click.option("--notification/--no-notification", default=True, help="Send report.")
-def run(number_of_tests, strict, notification):
+@click.option("--n-jobs", type=int, default=1, help="Number of parallel processes.")
+def run(number_of_tests, strict, notification, n_jobs):
     """Run a number of regression tests."""
     run_regression_tests(
-        n_tests=number_of_tests, strict=strict, notification=notification
+        n_tests=number_of_tests,
+        strict=strict,
+        notification=notification,
+        n_jobs=n_jobs,
     )
 
 
@@ -60,7 +60,9 @@ def create_draws_and_log_prob_wages(
     n_obs, n_choices = wages_systematic.shape
 
     choices = choices.astype(np.uint16)
-    relevant_systematic_wages = np.choose(choices, wages_systematic.T)
+    relevant_systematic_wages = np.take_along_axis(
+        wages_systematic, choices.reshape(-1, 1), axis=1
+    ).ravel()
     log_wage_systematic = np.log(
         np.clip(relevant_systematic_wages, 1 / MAX_FLOAT, MAX_FLOAT)
     )
@@ -75,7 +77,7 @@ def create_draws_and_log_prob_wages(
             shocks_cholesky, meas_sds, n_wages
         )
     else:
-        updated_chols = update_cholcov(shocks_cholesky, n_wages)
+        updated_chols = update_cholcov(shocks_cholesky, n_wages, cov)
 
     chol_indices = np.where(np.isfinite(log_wage_observed), choices, n_wages)
     draws = calculate_conditional_draws(
@@ -232,7 +234,7 @@ def update_cholcov_with_measurement_error(shocks_cholesky, meas_sds, n_wages):
     return updated_chols
 
 
-def update_cholcov(shocks_cholesky, n_wages):
+def update_cholcov(shocks_cholesky, n_wages, cov=None):
     """Calculate cholesky factors of conditional covs for all possible cases.
 
     Parameters
@@ -242,6 +244,9 @@ def update_cholcov(shocks_cholesky, n_wages):
         dimension (n_choices, n_choices)
     n_wages : int
         Number of wage sectors.
+    cov : numpy.ndarray, optional
+        Covariance matrix implied by ``shocks_cholesky``. Pass it if it is already
+        available to avoid recomputing it.
 
     Returns
     -------
@@ -252,23 +257,19 @@ def update_cholcov(shocks_cholesky, n_wages):
 
     """
     n_choices = len(shocks_cholesky)
-    cov = shocks_cholesky @ shocks_cholesky.T
+    if cov is None:
+        cov = shocks_cholesky @ shocks_cholesky.T
 
     updated_chols = np.zeros((n_wages + 1, n_choices, n_choices))
 
     for i in range(n_wages):
-        reduced_cov = np.delete(np.delete(cov, i, axis=1), i, axis=0)
-        choice_var = cov[i, i]
-
-        f = np.delete(cov[i], i)
-
-        updated_reduced_cov = reduced_cov - np.outer(f, f) / choice_var
-        updated_reduced_chol = robust_cholesky(updated_reduced_cov)
+        # Select all rows and columns except the one of the observed shock.
+        others = np.delete(np.arange(n_choices), i)
+        reduced_cov = cov[np.ix_(others, others)]
+        f = cov[i, others]
 
-        updated_chols[i, :i, :i] = updated_reduced_chol[:i, :i]
-        updated_chols[i, :i, i + 1 :] = updated_reduced_chol[:i, i:]
-        updated_chols[i, i + 1 :, :i] = updated_reduced_chol[i:, :i]
-        updated_chols[i, i + 1 :, i + 1 :] = updated_reduced_chol[i:, i:]
+        updated_reduced_cov = reduced_cov - np.outer(f, f) / cov[i, i]
+        updated_chols[i][np.ix_(others, others)] = robust_cholesky(updated_reduced_cov)
 
     updated_chols[-1] = shocks_cholesky
 
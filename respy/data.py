@@ -41,7 +41,10 @@ def create_kw_97(params, options):
     }
 
     df = pd.read_csv(
-        TEST_RESOURCES_DIR / "kw_97_data.csv", dtype=dtypes, float_precision="high"
+        TEST_RESOURCES_DIR / "kw_97_data.csv",
+        dtype=dtypes,
+        float_precision="high",
+        memory_map=True,
     )
 
     df.Identifier = df.groupby("Identifier").ngroup().astype(np.uint16)
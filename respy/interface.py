@@ -1,4 +1,6 @@
 """General interface functions for respy."""
+import copy
+import functools
 import warnings
 
 import pandas as pd
@@ -62,10 +64,9 @@ def get_example_model(model, with_data=True):
     """
     assert model in EXAMPLE_MODELS, f"{model} is not in {EXAMPLE_MODELS}."
 
-    options = yaml.safe_load((TEST_RESOURCES_DIR / f"{model}.yaml").read_text())
-    params = pd.read_csv(
-        TEST_RESOURCES_DIR / f"{model}.csv", index_col=["category", "name"]
-    )
+    params, options = _read_example_model(model)
+    params = params.copy()
+    options = copy.deepcopy(options)
 
     if "kw_97" in model and with_data:
         df = (create_kw_97(params, options),)
@@ -82,6 +83,26 @@ def get_example_model(model, with_data=True):
     return (params, options) + df
 
 
+@functools.lru_cache(maxsize=None)
+def _read_example_model(model):
+    """Read the parameters and options of an example model from disk.
+
+    The files are part of the package and do not change during a session. Thus, they
+    are parsed only once and :func:`get_example_model` returns copies of the cached
+    objects which can be modified without side-effects.
+
+    """
+    with (TEST_RESOURCES_DIR / f"{model}.yaml").open() as file:
+        options = yaml.safe_load(file)
+    params = pd.read_csv(
+        TEST_RESOURCES_DIR / f"{model}.csv",
+        index_col=["category", "name"],
+        memory_map=True,
+    )
+
+    return params, options
+
+
 def get_parameter_constraints(model):
     """Get parameter constraints for the estimation compatible with estimagic.
 
@@ -75,7 +75,8 @@ def _kw_94_interpolation(
 
     """
     n_wages = len(optim_paras["choices_w_wage"])
-    n_core_states_in_period = state_space.core.query("period == @period").shape[0]
+    period_slice = state_space.slices_by_periods[period]
+    n_core_states_in_period = period_slice.stop - period_slice.start
 
     seed = _get_seeds_for_interpolation(state_space, options)
     interp_points = _split_interpolation_points_evenly(state_space, options)
@@ -212,11 +213,14 @@ def _compute_rhs_variables(wages, nonpec, emaxs, draws, delta):
     )
 
     max_value_functions = value_functions.max(axis=1)
-    exogenous = max_value_functions.reshape(-1, 1) - value_functions
 
-    exogenous = np.column_stack(
-        (exogenous, np.sqrt(exogenous), np.ones(exogenous.shape[0]))
-    )
+    # Fill the pre-allocated design matrix in place instead of stacking temporaries.
+    n_states, n_choices = value_functions.shape
+    exogenous = np.empty((n_states, 2 * n_choices + 1))
+    differences = exogenous[:, :n_choices]
+    np.subtract(max_value_functions.reshape(-1, 1), value_functions, out=differences)
+    np.sqrt(differences, out=exogenous[:, n_choices:-1])
+    exogenous[:, -1] = 1
 
     return exogenous, max_value_functions
 
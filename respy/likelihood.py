@@ -9,6 +9,7 @@ from scipy import special
 
 from respy.conditional_draws import create_draws_and_log_prob_wages
 from respy.config import COVARIATES_DOT_PRODUCT_DTYPE
+from respy.config import INDEXER_DTYPE
 from respy.config import INDEXER_INVALID_INDEX
 from respy.config import MAX_FLOAT
 from respy.config import MIN_FLOAT
@@ -213,7 +214,7 @@ def _internal_log_like_obs(
         df.groupby(["identifier", "period", "type"])[["loglike_choice", "loglike_wage"]]
         .first()
         .unstack("type")
-        if optim_paras["n_types"] >= 2
+        if n_types >= 2
         else df[["loglike_choice", "loglike_wage"]]
     )
     per_observation_loglikes = loglikes["loglike_choice"] + loglikes["loglike_wage"]
@@ -243,12 +244,14 @@ def _internal_log_like_obs(
 def _compute_wage_and_choice_likelihood_contributions(
     df, base_draws_est, wages, nonpecs, expected_value_functions, optim_paras, options,
 ):
-    n_choices = len(optim_paras["choices"])
+    choice_labels = optim_paras["choices"]
+    n_choices = len(choice_labels)
     n_obs = df.shape[0]
 
     indices = df["index"].to_numpy()
 
     wages_systematic = wages[indices]
+    nonpecs_systematic = nonpecs[indices]
     log_wages_observed = df["log_wage"].to_numpy()
     choices = df["choice"].to_numpy()
 
@@ -267,14 +270,14 @@ def _compute_wage_and_choice_likelihood_contributions(
 
     # To get the continuation values, correctly index the expected value functions. This
     # is the same operation done in `_SingleDimStateSpace.get_continuation_values()`.
-    child_indices = df[[f"child_index_{c}" for c in optim_paras["choices"]]]
+    child_indices = df[[f"child_index_{c}" for c in choice_labels]].to_numpy()
     mask = child_indices != INDEXER_INVALID_INDEX
     valid_indices = np.where(mask, child_indices, 0)
     continuation_values = np.where(mask, expected_value_functions[valid_indices], 0)
 
     choice_loglikes = _simulate_log_probability_of_individuals_observed_choice(
-        wages[indices],
-        nonpecs[indices],
+        wages_systematic,
+        nonpecs_systematic,
         continuation_values,
         draws,
         optim_paras["beta_delta"],
@@ -303,20 +306,24 @@ def _compute_log_type_probabilities(df, optim_paras, options):
 @split_and_combine_df(remove_type=True)
 @parallelize_across_dense_dimensions
 def _compute_x_beta_for_type_probabilities(df, optim_paras, options):
-    for type_ in range(optim_paras["n_types"]):
+    n_types = optim_paras["n_types"]
+
+    for type_ in range(n_types):
+        type_params = optim_paras["type_prob"][type_]
+        labels = type_params.index
+
         first_observations = df.copy().assign(type=type_)
         relevant_covariates = identify_necessary_covariates(
-            optim_paras["type_prob"][type_].index, options["covariates_all"]
+            labels, options["covariates_all"]
         )
         first_observations = compute_covariates(first_observations, relevant_covariates)
 
-        labels = optim_paras["type_prob"][type_].index
         df[type_] = np.dot(
             first_observations[labels].to_numpy(dtype=COVARIATES_DOT_PRODUCT_DTYPE),
-            optim_paras["type_prob"][type_],
+            type_params,
         )
 
-    return df[range(optim_paras["n_types"])]
+    return df[range(n_types)]
 
 
 @nb.njit
@@ -333,11 +340,12 @@ def _logsumexp(x):
     underflows.
 
     """
-    # Search maximum.
-    max_x = None
+    # Search maximum. Start with the first element to avoid an optional type for
+    # `max_x` and a check against the sentinel in every iteration.
     length = len(x)
-    for i in range(length):
-        if max_x is None or x[i] > max_x:
+    max_x = x[0]
+    for i in range(1, length):
+        if x[i] > max_x:
             max_x = x[i]
 
     # Calculate sum of exponential differences.
@@ -480,28 +488,20 @@ def _process_estimation_data(df, state_space, optim_paras, options):
     df = convert_labeled_variables_to_codes(df, optim_paras)
 
     # Get indices of states in the state space corresponding to all observations for all
-    # types. The indexer has the shape (n_observations,).
-    n_periods = int(df.index.get_level_values("period").max() + 1)
-    indices = []
+    # types. The indexer has the shape (n_observations,). The indices of each period are
+    # written directly to the positions of the observations so that the individual-period
+    # order of the data is kept and no reordering is necessary.
+    periods = df.index.get_level_values("period").to_numpy()
     core_columns = create_core_state_space_columns(optim_paras)
+    core = df[core_columns].to_numpy()
+    indices = np.empty(df.shape[0], dtype=INDEXER_DTYPE)
 
-    for period in range(n_periods):
-        period_df = df.query("period == @period")
-        period_core = tuple(period_df[col].to_numpy() for col in core_columns)
-        period_indices = state_space.indexer[period][period_core]
-        indices.append(period_indices)
-
-    indices = np.concatenate(indices)
-
-    # The indexer is now sorted in period-individual pairs whereas the estimation needs
-    # individual-period pairs. Sort it!
-    indices_to_reorder = (
-        df.sort_values(["period", "identifier"])
-        .assign(__index__=np.arange(df.shape[0]))
-        .sort_values(["identifier", "period"])["__index__"]
-        .to_numpy()
-    )
-    df["index"] = indices[indices_to_reorder]
+    for period in range(periods.max() + 1):
+        is_period = periods == period
+        period_core = tuple(core[is_period].T)
+        indices[is_period] = state_space.indexer[period][period_core]
+
+    df["index"] = indices
 
     # Add indices of child states to the DataFrame.
     children = pd.DataFrame(
@@ -536,12 +536,12 @@ def _adjust_optim_paras_for_estimation(optim_paras, df):
     which can be suppressed by adjusting the optim_paras.
 
     """
+    first_period = df.query("Period == 0")
+
     for choice in optim_paras["choices_w_exp"]:
 
         # Adjust initial experience levels for all choices with experiences.
-        init_exp_data = np.sort(
-            df.query("Period == 0")[f"Experience_{choice.title()}"].unique()
-        )
+        init_exp_data = np.sort(first_period[f"Experience_{choice.title()}"].unique())
         init_exp_params = np.array(list(optim_paras["choices"][choice]["start"]))
         if not np.array_equal(init_exp_data, init_exp_params):
             warnings.warn(
@@ -37,10 +37,14 @@ def parallelize_across_dense_dimensions(func=None, *, n_jobs=1):
             if dense_indices:
                 args_, kwargs_ = _broadcast_arguments(args, kwargs, dense_indices)
 
-                out = joblib.Parallel(n_jobs=n_jobs)(
-                    joblib.delayed(func)(*args_[idx], **kwargs_[idx])
-                    for idx in dense_indices
-                )
+                # Avoid the dispatching overhead of joblib for sequential execution.
+                if n_jobs == 1:
+                    out = [func(*args_[idx], **kwargs_[idx]) for idx in dense_indices]
+                else:
+                    out = joblib.Parallel(n_jobs=n_jobs)(
+                        joblib.delayed(func)(*args_[idx], **kwargs_[idx])
+                        for idx in dense_indices
+                    )
 
                 # Re-order multiple return values from list of tuples to tuple of lists
                 # to tuple of dictionaries to set as state space attributes.
@@ -194,10 +198,10 @@ def _infer_dense_indices_from_arguments(args, kwargs):
     list_of_dense_indices = []
     for arg in args:
         if _is_dictionary_with_tuple_keys(arg):
-            list_of_dense_indices.append(set(arg.keys()))
+            list_of_dense_indices.append(set(arg))
     for kwarg in kwargs.values():
         if _is_dictionary_with_tuple_keys(kwarg):
-            list_of_dense_indices.append(set(kwarg.keys()))
+            list_of_dense_indices.append(set(kwarg))
 
     intersection_of_dense_indices = (
         set.intersection(*list_of_dense_indices) if list_of_dense_indices else []
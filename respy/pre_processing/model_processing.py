@@ -28,6 +28,17 @@ from respy.shared import normalize_probabilities
 
 warnings.simplefilter("error", category=pd.errors.PerformanceWarning)
 
+# Patterns which are matched against every parameter name or covariate formula.
+_EXPERIENCE_PATTERN = re.compile(r"\bexp_([A-Za-z_]+)\b")
+_LAGGED_CHOICE_PATTERN = re.compile(r"lagged_choice_([0-9]+)")
+
+# Placeholders in `"core_state_space_filters"` and the group of choices they loop over.
+_FILTER_PLACEHOLDERS = {
+    "{i}": "choices_w_exp",
+    "{j}": "choices_wo_exp",
+    "{k}": "choices_w_wage",
+}
+
 
 def process_params_and_options(params, options):
     """Process `params` and `options`.
@@ -54,7 +65,9 @@ def process_params_and_options(params, options):
 def _read_options(dict_or_path):
     """Read the options which can either be a dictionary or a path."""
     if isinstance(dict_or_path, Path):
-        options = yaml.safe_load(dict_or_path.read_text())
+        # Pass the file object to let the parser consume the file incrementally.
+        with dict_or_path.open() as file:
+            options = yaml.safe_load(file)
     elif isinstance(dict_or_path, dict):
         options = copy.deepcopy(dict_or_path)
     else:
@@ -117,9 +130,7 @@ def _create_internal_seeds_from_user_seeds(options):
 def _read_params(df_or_series):
     """Read the parameters which can either be a path, a Series, or a DataFrame."""
     if isinstance(df_or_series, Path):
-        df_or_series = pd.read_csv(df_or_series)
-    else:
-        df_or_series.copy()
+        df_or_series = pd.read_csv(df_or_series, memory_map=True)
 
     if isinstance(df_or_series, pd.DataFrame):
         if not df_or_series.index.names == ["category", "name"]:
@@ -233,7 +244,7 @@ def _parse_choices(optim_paras, params, options):
     choices_wo_exp_wo_wage = choices_w_nonpec - choices_w_exp_fuzzy
 
     optim_paras["choices_w_wage"] = sorted(choices_w_wage)
-    optim_paras["choices_w_exp"] = sorted(choices_w_wage) + sorted(
+    optim_paras["choices_w_exp"] = optim_paras["choices_w_wage"] + sorted(
         choices_w_exp_wo_wage
     )
     optim_paras["choices_wo_exp"] = sorted(choices_wo_exp_wo_wage)
@@ -420,11 +431,13 @@ def _infer_choices_with_experience(params, options):
 
     used_covariates = [cov for cov in covariates if cov in parameters]
 
-    matches = []
-    for param in parameters:
-        matches += re.findall(r"\bexp_([A-Za-z_]+)\b", str(param))
-    for cov in used_covariates:
-        matches += re.findall(r"\bexp_([A-Za-z_]+)\b", covariates[cov])
+    strings = itertools.chain(
+        (str(param) for param in parameters),
+        (covariates[cov] for cov in used_covariates),
+    )
+    matches = itertools.chain.from_iterable(
+        _EXPERIENCE_PATTERN.findall(string) for string in strings
+    )
 
     return sorted(set(matches))
 
@@ -470,20 +483,20 @@ def _parse_lagged_choices(optim_paras, options, params):
         If the model contains superfluous definitions of lagged choices.
 
     """
-    regex_pattern = r"lagged_choice_([0-9]+)"
-
     # First, infer the number of lags from all covariates.
     covariates = options["covariates"]
-    matches = []
-    for cov in covariates:
-        matches += re.findall(regex_pattern, covariates[cov])
+    matches = list(
+        itertools.chain.from_iterable(
+            _LAGGED_CHOICE_PATTERN.findall(formula) for formula in covariates.values()
+        )
+    )
 
     n_lc_covariates = 0 if not matches else pd.to_numeric(matches).max()
 
     # Second, infer the number of lags defined in params.
     matches_params = list(
         params.index.get_level_values("category")
-        .str.extract(regex_pattern, expand=False)
+        .str.extract(_LAGGED_CHOICE_PATTERN.pattern, expand=False)
         .dropna()
         .unique()
     )
@@ -576,11 +589,11 @@ def _parse_probabilities_or_logit_coefficients(params, regex_for_levels):
     not sum to one.
 
     """
-    mask = (
-        params.index.get_level_values("category")
-        .str.extract(regex_for_levels, expand=False)
-        .notna()
+    # Extract the levels once and reuse them for the mask and the subset.
+    all_levels = params.index.get_level_values("category").str.extract(
+        regex_for_levels, expand=False
     )
+    mask = all_levels.notna()
     n_parameters = mask.sum()
 
     # If parameters for initial experiences are specified, the parameters can either
@@ -589,10 +602,7 @@ def _parse_probabilities_or_logit_coefficients(params, regex_for_levels):
         # Work on subset.
         sub = params.loc[mask].copy()
 
-        levels = sub.index.get_level_values("category").str.extract(
-            regex_for_levels, expand=False
-        )
-        levels = pd.to_numeric(levels, errors="ignore")
+        levels = pd.to_numeric(all_levels[mask], errors="ignore")
         unique_levels = sorted(levels.unique())
 
         n_probabilities = (sub.index.get_level_values("name") == "probability").sum()
@@ -723,11 +733,10 @@ def _add_default_is_inadmissible(options, optim_paras):
             if max_exp != optim_paras["n_periods"] - 1
             else "False"
         )
-        formulas = inadmissible_states.get(choice, [])
-        inadmissible_states[choice] = formulas + [formula]
+        inadmissible_states.setdefault(choice, []).append(formula)
 
     for choice in optim_paras["choices_wo_exp"]:
-        inadmissible_states[choice] = inadmissible_states.get(choice, ["False"])
+        inadmissible_states.setdefault(choice, ["False"])
 
     return options
 
@@ -769,6 +778,10 @@ def _replace_choices_and_observables_in_formula(formula, optim_paras):
     with their codes.
 
     """
+    # Most formulas do not contain any quoted labels and need no replacement.
+    if "'" not in formula and '"' not in formula:
+        return formula
+
     observables = optim_paras["observables"]
 
     for i, choice in enumerate(optim_paras["choices"]):
@@ -799,31 +812,19 @@ def _convert_labels_in_filters_to_codes(optim_paras, options):
     filters = []
 
     for filter_ in options["core_state_space_filters"]:
-        # If "{i}" is in filter_, loop over choices with experiences.
-        if "{i}" in filter_:
-            for choice in optim_paras["choices_w_exp"]:
-                fltr_ = filter_.replace("{i}", choice)
-                fltr_ = _replace_choices_and_observables_in_formula(fltr_, optim_paras)
-                filters.append(fltr_)
-
-        # If "{j}" is in filter_, loop over choices without experiences.
-        elif "{j}" in filter_:
-            for choice in optim_paras["choices_wo_exp"]:
-                fltr = filter_.replace("{j}", choice)
-                fltr = _replace_choices_and_observables_in_formula(fltr, optim_paras)
-                filters.append(fltr)
-
-        # If "{k}" is in filter_, loop over choices with wage.
-        elif "{k}" in filter_:
-            for choice in optim_paras["choices_w_wage"]:
-                fltr = filter_.replace("{k}", choice)
-                fltr = _replace_choices_and_observables_in_formula(fltr, optim_paras)
-                filters.append(fltr)
+        # Only the first placeholder found in the filter is expanded.
+        placeholder = next((p for p in _FILTER_PLACEHOLDERS if p in filter_), None)
 
-        else:
+        if placeholder is None:
             filter_ = _replace_choices_and_observables_in_formula(filter_, optim_paras)
             filters.append(filter_)
 
+        else:
+            for choice in optim_paras[_FILTER_PLACEHOLDERS[placeholder]]:
+                fltr = filter_.replace(placeholder, choice)
+                fltr = _replace_choices_and_observables_in_formula(fltr, optim_paras)
+                filters.append(fltr)
+
     options["core_state_space_filters"] = filters
 
     return options
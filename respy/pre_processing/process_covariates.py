@@ -27,9 +27,10 @@ def remove_irrelevant_covariates(options, params):
     covariates = options["covariates"]
 
     # Collect initial relevant covariates from params.
+    names = set(params.index.get_level_values("name"))
     relevant_covs = {}
     for cov in covariates:
-        if cov in params.index.get_level_values("name"):
+        if cov in names:
             relevant_covs[cov] = covariates[cov]
 
     # Start by iterating over initial covariates and add variables which are used to
@@ -12,6 +12,9 @@ import pandas as pd
 from respy.config import MAX_LOG_FLOAT
 from respy.config import MIN_LOG_FLOAT
 
+# Map names of low-discrepancy sequences to the sampling rules of chaospy.
+_QUASI_RANDOM_SAMPLING_RULES = {"halton": "H", "sobol": "S"}
+
 
 @nb.njit
 def aggregate_keane_wolpin_utility(wage, nonpec, continuation_value, draw, delta):
@@ -109,13 +112,10 @@ def create_base_draws(shape, seed, monte_carlo_sequence):
     if monte_carlo_sequence == "random":
         draws = np.random.standard_normal(shape)
 
-    elif monte_carlo_sequence == "halton":
-        distribution = cp.MvNormal(loc=np.zeros(n_choices), scale=np.eye(n_choices))
-        draws = distribution.sample(n_points, rule="H").T.reshape(shape)
-
-    elif monte_carlo_sequence == "sobol":
+    elif monte_carlo_sequence in _QUASI_RANDOM_SAMPLING_RULES:
+        rule = _QUASI_RANDOM_SAMPLING_RULES[monte_carlo_sequence]
         distribution = cp.MvNormal(loc=np.zeros(n_choices), scale=np.eye(n_choices))
-        draws = distribution.sample(n_points, rule="S").T.reshape(shape)
+        draws = distribution.sample(n_points, rule=rule).T.reshape(shape)
 
     else:
         raise NotImplementedError
@@ -145,9 +145,11 @@ def transform_base_draws_with_cholesky_factor(draws, shocks_cholesky, n_wages):
 
     """
     draws_transformed = draws.dot(shocks_cholesky.T)
-    draws_transformed[..., :n_wages] = np.exp(
-        np.clip(draws_transformed[..., :n_wages], MIN_LOG_FLOAT, MAX_LOG_FLOAT)
-    )
+
+    # Clip and exponentiate the view on the wage shocks in place to avoid temporaries.
+    wage_draws = draws_transformed[..., :n_wages]
+    np.clip(wage_draws, MIN_LOG_FLOAT, MAX_LOG_FLOAT, out=wage_draws)
+    np.exp(wage_draws, out=wage_draws)
 
     return draws_transformed
 
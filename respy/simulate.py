@@ -2,12 +2,12 @@
 import functools
 import warnings
 
+import numba as nb
 import numpy as np
 import pandas as pd
 from scipy.special import softmax
 
 from respy.config import COVARIATES_DOT_PRODUCT_DTYPE
-from respy.config import INDEXER_INVALID_INDEX
 from respy.parallelization import parallelize_across_dense_dimensions
 from respy.parallelization import split_and_combine_df
 from respy.pre_processing.model_processing import process_params_and_options
@@ -182,6 +182,7 @@ def simulate(params, base_draws_sim, base_draws_wage, df, solve, options):
         current_df_extended = _simulate_single_period(
             current_df,
             state_space.indexer[period],
+            state_space.slices_by_periods[period].start,
             wages,
             nonpecs,
             continuation_values,
@@ -275,7 +276,14 @@ def _extend_data_with_sampled_characteristics(df, optim_paras, options):
 @split_and_combine_df
 @parallelize_across_dense_dimensions
 def _simulate_single_period(
-    df, indexer, wages, nonpecs, continuation_values, is_inadmissible, optim_paras
+    df,
+    indexer,
+    first_index,
+    wages,
+    nonpecs,
+    continuation_values,
+    is_inadmissible,
+    optim_paras,
 ):
     """Simulate individuals in a single period.
 
@@ -289,11 +297,11 @@ def _simulate_single_period(
     n_wages = len(optim_paras["choices_w_wage"])
 
     # Get indices which connect states in the state space and simulated agents. Subtract
-    # the minimum of indices (excluding invalid indices) because wages, etc. contain
-    # only wages in this period and normal indices select rows from all wages.
+    # the index of the first state in the period because wages, etc. contain only wages
+    # in this period and normal indices select rows from all wages.
     columns = create_core_state_space_columns(optim_paras)
     indices = indexer[tuple(df[col].astype("int64") for col in columns)]
-    period_indices = indices - np.min(indexer[indexer != INDEXER_INVALID_INDEX])
+    period_indices = indices - first_index
 
     try:
         wages = wages[period_indices]
@@ -314,16 +322,24 @@ def _simulate_single_period(
         wages, nonpecs, continuation_values, draws_shock, optim_paras["beta_delta"],
     )
 
-    # We need to ensure that no individual chooses an inadmissible state. Thus, set
-    # value functions to NaN. This cannot be done in `aggregate_keane_wolpin_utility` as
-    # the interpolation requires a mild penalty.
-    value_functions = np.where(is_inadmissible, np.nan, value_functions)
-
-    choice = np.nanargmax(value_functions, axis=1)
-
-    wages = wages * draws_shock * draws_wage
-    wages[:, n_wages:] = np.nan
-    wage = np.choose(choice, wages.T)
+    # We need to ensure that no individual chooses an inadmissible state. This cannot be
+    # done in `aggregate_keane_wolpin_utility` as the interpolation requires a mild
+    # penalty.
+    choice = _choose_maximizing_admissible_alternative(value_functions, is_inadmissible)
+    if np.any(choice == -1):
+        raise ValueError("Some individuals have no admissible choice.")
+
+    # Only choices with wages have realized wages. Compute them directly into a buffer
+    # pre-filled with NaNs instead of computing all columns and overwriting some.
+    realized_wages = np.full(wages.shape, np.nan)
+    np.multiply(
+        wages[:, :n_wages], draws_shock[:, :n_wages], out=realized_wages[:, :n_wages]
+    )
+    realized_wages[:, :n_wages] *= draws_wage[:, :n_wages]
+    wages = realized_wages
+    # Gather the realized wage of the chosen alternative which is NaN for choices without
+    # wages.
+    wage = np.take_along_axis(wages, choice.reshape(-1, 1), axis=1).ravel()
 
     # Store necessary information and information for debugging, etc..
     df["choice"] = choice
@@ -340,6 +356,46 @@ def _simulate_single_period(
     return df
 
 
+@nb.guvectorize(
+    ["f8[:], b1[:], i8[:]"], "(n_choices), (n_choices) -> ()", nopython=True
+)
+def _choose_maximizing_admissible_alternative(value_functions, is_inadmissible, choice):
+    """Choose the admissible alternative with the highest value function.
+
+    The function is equivalent to setting the value functions of inadmissible choices to
+    NaN and applying :func:`numpy.nanargmax` to each row, but it finds the maximum and
+    its position in a single pass without creating temporary arrays. Ties are resolved
+    in favor of the first alternative.
+
+    Parameters
+    ----------
+    value_functions : numpy.ndarray
+        Array with shape (n_choices,).
+    is_inadmissible : numpy.ndarray
+        Array with shape (n_choices,) indicating inadmissible choices.
+
+    Returns
+    -------
+    choice : int
+        Index of the chosen alternative or -1 if no alternative is admissible.
+
+    """
+    max_idx = -1
+    max_value = 0.0
+
+    for i in range(value_functions.shape[0]):
+        value_function = value_functions[i]
+        if (
+            not is_inadmissible[i]
+            and not np.isnan(value_function)
+            and (max_idx == -1 or value_function > max_value)
+        ):
+            max_idx = i
+            max_value = value_function
+
+    choice[0] = max_idx
+
+
 def _sample_characteristic(states_df, options, level_dict, use_keys):
     """Sample characteristic of individuals.
 
@@ -544,9 +600,12 @@ def _apply_law_of_motion(df, optim_paras):
     df = df.copy()
     n_lagged_choices = optim_paras["n_lagged_choices"]
 
-    # Update work experiences.
-    for i, choice in enumerate(optim_paras["choices_w_exp"]):
-        df[f"exp_{choice}"] += df["choice"] == i
+    # Update work experiences. Row `i` of the lookup table indicates which experience is
+    # incremented if choice `i` is taken. Choices without experience increment nothing.
+    # Adding booleans preserves the dtypes of the experience columns.
+    exp_columns = [f"exp_{choice}" for choice in optim_paras["choices_w_exp"]]
+    increments = np.eye(len(optim_paras["choices"]), len(exp_columns), dtype=np.bool_)
+    df[exp_columns] += increments[df["choice"].to_numpy()]
 
     # Update lagged choices by deleting oldest lagged, renaming other lags and inserting
     # choice in the first position.
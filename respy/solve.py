@@ -2,6 +2,7 @@
 import functools
 
 import numpy as np
+import pandas as pd
 
 from respy.config import COVARIATES_DOT_PRODUCT_DTYPE
 from respy.config import INADMISSIBILITY_PENALTY
@@ -48,7 +49,13 @@ def solve(params, options, state_space):
     states = state_space.states
     is_inadmissible = state_space.get_attribute("is_inadmissible")
 
-    wages, nonpecs = _create_choice_rewards(states, is_inadmissible, optim_paras)
+    # The coefficients are equal for all dense dimensions. Stack them only once.
+    wage_coefficients = _stack_coefficients_of_choices(optim_paras, "wage")
+    nonpec_coefficients = _stack_coefficients_of_choices(optim_paras, "nonpec")
+
+    wages, nonpecs = _create_choice_rewards(
+        states, is_inadmissible, wage_coefficients, nonpec_coefficients, optim_paras
+    )
     state_space.set_attribute("wages", wages)
     state_space.set_attribute("nonpecs", nonpecs)
 
@@ -58,34 +65,46 @@ def solve(params, options, state_space):
 
 
 @parallelize_across_dense_dimensions
-def _create_choice_rewards(states, is_inadmissible, optim_paras):
+def _create_choice_rewards(
+    states, is_inadmissible, wage_coefficients, nonpec_coefficients, optim_paras
+):
     """Create wage and non-pecuniary reward for each state and choice.
 
     Note that missing wages filled with ones and missing non-pecuniary rewards with
     zeros. This is done in :meth:`_initialize_attributes`.
 
+    The coefficients are created with :func:`_stack_coefficients_of_choices`.
+
     """
     n_states = states.shape[0]
     n_choices = len(optim_paras["choices"])
 
-    wages = np.ones((n_states, n_choices))
-    nonpecs = np.zeros((n_states, n_choices))
+    # Only columns of choices without the reward are filled with defaults below, all
+    # other columns are overwritten anyway.
+    wages = np.empty((n_states, n_choices))
+    nonpecs = np.empty((n_states, n_choices))
+
+    # Compute the rewards of all choices with one matrix product per reward type instead
+    # of one dot product per choice.
+    if not wage_coefficients.empty:
+        log_wages = (
+            states[wage_coefficients.index].to_numpy(dtype=COVARIATES_DOT_PRODUCT_DTYPE)
+            @ wage_coefficients.to_numpy()
+        )
+        # Exponentiate in place to avoid another temporary of the same size.
+        wages[:, wage_coefficients.columns] = np.exp(log_wages, out=log_wages)
 
-    for i, choice in enumerate(optim_paras["choices"]):
-        if f"wage_{choice}" in optim_paras:
-            wage_columns = optim_paras[f"wage_{choice}"].index
-            log_wage = np.dot(
-                states[wage_columns].to_numpy(dtype=COVARIATES_DOT_PRODUCT_DTYPE),
-                optim_paras[f"wage_{choice}"].to_numpy(),
+    if not nonpec_coefficients.empty:
+        nonpecs[:, nonpec_coefficients.columns] = (
+            states[nonpec_coefficients.index].to_numpy(
+                dtype=COVARIATES_DOT_PRODUCT_DTYPE
             )
-            wages[:, i] = np.exp(log_wage)
+            @ nonpec_coefficients.to_numpy()
+        )
 
-        if f"nonpec_{choice}" in optim_paras:
-            nonpec_columns = optim_paras[f"nonpec_{choice}"].index
-            nonpecs[:, i] = np.dot(
-                states[nonpec_columns].to_numpy(dtype=COVARIATES_DOT_PRODUCT_DTYPE),
-                optim_paras[f"nonpec_{choice}"].to_numpy(),
-            )
+    choices = np.arange(n_choices)
+    wages[:, ~np.isin(choices, wage_coefficients.columns)] = 1
+    nonpecs[:, ~np.isin(choices, nonpec_coefficients.columns)] = 0
 
     # For inadmissible choices apply a penalty to the non-pecuniary rewards.
     penalty = optim_paras["inadmissibility_penalty"]
@@ -95,6 +114,23 @@ def _create_choice_rewards(states, is_inadmissible, optim_paras):
     return wages, nonpecs
 
 
+def _stack_coefficients_of_choices(optim_paras, prefix):
+    """Stack the coefficients of a reward type for all choices into a matrix.
+
+    The rows of the returned :class:`pandas.DataFrame` are the union of covariates and
+    the columns are the positions of the choices having the reward. Coefficients of
+    covariates which do not affect the reward of a choice are zero.
+
+    """
+    coefficients = {
+        i: optim_paras[f"{prefix}_{choice}"]
+        for i, choice in enumerate(optim_paras["choices"])
+        if f"{prefix}_{choice}" in optim_paras
+    }
+
+    return pd.DataFrame(coefficients).fillna(0)
+
+
 def _solve_with_backward_induction(state_space, optim_paras, options):
     """Calculate utilities with backward induction.
 
@@ -119,22 +155,20 @@ def _solve_with_backward_induction(state_space, optim_paras, options):
         state_space.base_draws_sol, optim_paras["shocks_cholesky"], n_wages
     )
 
-    for period in reversed(range(n_periods)):
-        n_core_states = state_space.core.query("period == @period").shape[0]
+    # The number of interpolation points is the same for all periods. Thus, for some
+    # periods the number of interpolation points is larger than the actual number of
+    # states. In this case, no interpolation is needed.
+    interpolation_points = options["interpolation_points"]
+    n_dense_combinations = len(getattr(state_space, "sub_state_spaces", [1]))
 
-        wages = state_space.get_attribute_from_period("wages", period)
-        nonpecs = state_space.get_attribute_from_period("nonpecs", period)
-        continuation_values = state_space.get_continuation_values(period)
+    for period in reversed(range(n_periods)):
+        period_slice = state_space.slices_by_periods[period]
+        n_core_states = period_slice.stop - period_slice.start
         period_draws_emax_risk = draws_emax_risk[period]
 
-        # The number of interpolation points is the same for all periods. Thus, for
-        # some periods the number of interpolation points is larger than the actual
-        # number of states. In this case, no interpolation is needed.
-        n_dense_combinations = len(getattr(state_space, "sub_state_spaces", [1]))
         n_states_in_period = n_core_states * n_dense_combinations
         any_interpolated = (
-            options["interpolation_points"] <= n_states_in_period
-            and options["interpolation_points"] != -1
+            interpolation_points != -1 and interpolation_points <= n_states_in_period
         )
 
         # Handle myopic individuals.
@@ -152,6 +186,9 @@ def _solve_with_backward_induction(state_space, optim_paras, options):
             )
 
         else:
+            wages = state_space.get_attribute_from_period("wages", period)
+            nonpecs = state_space.get_attribute_from_period("nonpecs", period)
+            continuation_values = state_space.get_continuation_values(period)
             period_expected_value_functions = _full_solution(
                 wages, nonpecs, continuation_values, period_draws_emax_risk, optim_paras
             )
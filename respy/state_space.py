@@ -113,12 +113,12 @@ class _BaseStateSpace:
         indices = np.full(
             (n_states, n_choices), INDEXER_INVALID_INDEX, dtype=INDEXER_DTYPE
         )
+        # Convert the core states once and select periods with the precomputed slices.
+        core = self.core[core_columns].to_numpy(dtype=np.int8)
 
         # Skip the last period which does not have child states.
         for period in reversed(range(n_periods - 1)):
-            states_in_period = self.core.query("period == @period")[
-                core_columns
-            ].to_numpy(dtype=np.int8)
+            states_in_period = core[self.slices_by_periods[period]]
 
             indices = _insert_indices_of_child_states(
                 indices,
@@ -132,6 +132,21 @@ class _BaseStateSpace:
 
         return indices
 
+    def _create_valid_indices_of_child_states(self):
+        """Replace invalid indices of child states with zeros and keep a mask.
+
+        The indices of child states do not depend on the parameters. Thus, the indices
+        which are safe to use for indexing and the mask of valid indices are computed
+        once and shared by all sub state spaces.
+
+        """
+        is_valid_child_state = self.indices_of_child_states != INDEXER_INVALID_INDEX
+        valid_indices_of_child_states = np.where(
+            is_valid_child_state, self.indices_of_child_states, 0
+        )
+
+        return valid_indices_of_child_states, is_valid_child_state
+
 
 class _SingleDimStateSpace(_BaseStateSpace):
     """The state space of a discrete choice dynamic programming model.
@@ -184,6 +199,8 @@ class _SingleDimStateSpace(_BaseStateSpace):
         is_inadmissible=None,
         indices_of_child_states=None,
         slices_by_periods=None,
+        valid_indices_of_child_states=None,
+        is_valid_child_state=None,
     ):
         self.dense_dim = dense_dim
         self.core = core
@@ -206,8 +223,16 @@ class _SingleDimStateSpace(_BaseStateSpace):
             if indices_of_child_states is None
             else indices_of_child_states
         )
+        if valid_indices_of_child_states is None:
+            (
+                valid_indices_of_child_states,
+                is_valid_child_state,
+            ) = super()._create_valid_indices_of_child_states()
+        self.valid_indices_of_child_states = valid_indices_of_child_states
+        self.is_valid_child_state = is_valid_child_state
         # HOTFIX: Will be removed with flexible choice sets.
         self.expected_value_functions = np.empty(self.core.shape[0])
+        self._states = None
 
     def get_attribute(self, attr):
         """Get an attribute of the state space."""
@@ -264,15 +289,16 @@ class _SingleDimStateSpace(_BaseStateSpace):
         else:
             if indices is not None:
                 child_indices = self.get_attribute("indices_of_child_states")[indices]
+                mask = child_indices != INDEXER_INVALID_INDEX
+                valid_indices = np.where(mask, child_indices, 0)
             elif period is not None and 0 <= period <= n_periods - 2:
-                child_indices = self.get_attribute_from_period(
-                    "indices_of_child_states", period
+                valid_indices = self.get_attribute_from_period(
+                    "valid_indices_of_child_states", period
                 )
+                mask = self.get_attribute_from_period("is_valid_child_state", period)
             else:
                 raise NotImplementedError
 
-            mask = child_indices != INDEXER_INVALID_INDEX
-            valid_indices = np.where(mask, child_indices, 0)
             continuation_values = np.where(
                 mask, self.get_attribute("expected_value_functions")[valid_indices], 0
             )
@@ -287,9 +313,17 @@ class _SingleDimStateSpace(_BaseStateSpace):
 
     @property
     def states(self):
-        states = self.core.copy().assign(**self.dense_covariates)
-        states = compute_covariates(states, self.mixed_covariates)
-        return states
+        """Core states combined with dense and mixed covariates.
+
+        The states do not depend on the parameters of the model. Thus, they are only
+        computed on first access and reused for every following solution of the model.
+
+        """
+        if self._states is None:
+            states = self.core.assign(**self.dense_covariates)
+            self._states = compute_covariates(states, self.mixed_covariates)
+
+        return self._states
 
 
 class _MultiDimStateSpace(_BaseStateSpace):
@@ -304,10 +338,14 @@ class _MultiDimStateSpace(_BaseStateSpace):
         self.core = core
         self.indexer = indexer
         self.is_inadmissible = super()._create_is_inadmissible(optim_paras, options)
+        self.slices_by_periods = super()._create_slices_by_core_periods()
         self.indices_of_child_states = super()._create_indices_of_child_states(
             optim_paras
         )
-        self.slices_by_periods = super()._create_slices_by_core_periods()
+        (
+            self.valid_indices_of_child_states,
+            self.is_valid_child_state,
+        ) = super()._create_valid_indices_of_child_states()
         self.sub_state_spaces = {
             dense_dim: _SingleDimStateSpace(
                 self.core,
@@ -320,6 +358,8 @@ class _MultiDimStateSpace(_BaseStateSpace):
                 self.is_inadmissible,
                 self.indices_of_child_states,
                 self.slices_by_periods,
+                self.valid_indices_of_child_states,
+                self.is_valid_child_state,
             )
             for dense_dim, dense_covariates in dense.items()
         }
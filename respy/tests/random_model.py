@@ -159,7 +159,7 @@ def generate_random_model(
             .dropna()
             .unique()
         )
-        observable_covs = {x: "{} == {}".format(*x.rsplit("_", 1)) for x in indices}
+        observable_covs = {x: " == ".join(x.rsplit("_", 1)) for x in indices}
     else:
         observable_covs = {}
 
@@ -11,6 +11,18 @@ def test_get_example_model(model):
     params, options = get_example_model(model, with_data=False)
 
 
+@pytest.mark.unit
+def test_get_example_model_returns_independent_copies():
+    params, options = get_example_model("kw_94_one", with_data=False)
+    params.loc[("delta", "delta"), "value"] = -1
+    options["n_periods"] = -1
+
+    params_, options_ = get_example_model("kw_94_one", with_data=False)
+
+    assert params_.loc[("delta", "delta"), "value"] != -1
+    assert options_["n_periods"] != -1
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize("model", EXAMPLE_MODELS)
 def test_get_parameter_constraints(model):
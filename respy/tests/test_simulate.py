@@ -9,6 +9,7 @@ from respy.likelihood import get_crit_func
 from respy.pre_processing.data_checking import check_simulated_data
 from respy.pre_processing.model_processing import process_params_and_options
 from respy.pre_processing.specification_helpers import generate_obs_labels
+from respy.simulate import _choose_maximizing_admissible_alternative
 from respy.tests.random_model import generate_random_model
 from respy.tests.utils import process_model_or_seed
 
@@ -143,3 +144,18 @@ def test_distribution_of_observables():
         ]
 
         np.testing.assert_allclose(probability, params_probability, atol=0.05)
+
+
+@pytest.mark.unit
+def test_choose_maximizing_admissible_alternative_equals_nanargmax():
+    value_functions = np.random.normal(size=(1_000, 4))
+    value_functions[np.random.uniform(size=value_functions.shape) < 0.05] = np.nan
+    is_inadmissible = np.random.uniform(size=value_functions.shape) < 0.3
+    # Ensure that every individual has at least one valid alternative.
+    is_inadmissible[:, 0] = False
+    value_functions[:, 0] = np.nan_to_num(value_functions[:, 0])
+
+    expected = np.nanargmax(np.where(is_inadmissible, np.nan, value_functions), axis=1)
+    result = _choose_maximizing_admissible_alternative(value_functions, is_inadmissible)
+
+    np.testing.assert_array_equal(result, expected)